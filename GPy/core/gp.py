@@ -9,6 +9,7 @@ from .. import likelihoods
 from .. import kern
 from ..inference.latent_function_inference import exact_gaussian_inference, expectation_propagation
 from ..util.normalizer import Standardize
+from ..util.linalg import jitchol
 from paramz import ObsAr
 
 import logging
@@ -30,12 +31,26 @@ class GP(Model):
         Prediction will be un-normalized using this normalizer.
         If normalizer is True, we will normalize using Standardize.
         If normalizer is False, no normalization will be done.
+    :param compute_dtype: floating point type of the triangular solve and
+        rank-k update in the predictive variance (np.float64 by default).
+        np.float32 roughly halves the cost of large predictions, but only
+        keeps about seven significant digits of the variance. Inference
+        itself is always carried out in double precision, and only exact
+        Gaussian posteriors make use of this setting.
 
     .. Note:: Multiple independent outputs are allowed using columns of Y
 
 
     """
-    def __init__(self, X, Y, kernel, likelihood, mean_function=None, inference_method=None, name='gp', Y_metadata=None, normalizer=False):
+    # defaults for models pickled before these attributes existed
+    _compute_dtype = np.dtype(np.float64)
+    _pred_cache = None
+
+    # posterior_samples_f only keeps the (Nnew x Nnew) Cholesky factor of the
+    # predictive covariance between calls for up to this many test points
+    sample_chol_cache_max_points = 1000
+
+    def __init__(self, X, Y, kernel, likelihood, mean_function=None, inference_method=None, name='gp', Y_metadata=None, normalizer=False, compute_dtype=np.float64):
         super(GP, self).__init__(name)
 
         assert X.ndim == 2
@@ -99,13 +114,22 @@ class GP(Model):
                 inference_method = exact_gaussian_inference.ExactGaussianInference()
             else:
                 inference_method = expectation_propagation.EP()
-                print("defaulting to " + str(inference_method) + " for latent function inference")
+                logger.info("defaulting to " + str(inference_method) + " for latent function inference")
         self.inference_method = inference_method
 
         logger.info("adding kernel and likelihood as parameters")
         self.link_parameter(self.kern)
         self.link_parameter(self.likelihood)
         self.posterior = None
+        self._pred_cache = {}
+        self.compute_dtype = compute_dtype
+
+    def __getstate__(self):
+        dc = super(GP, self).__getstate__()
+        # the prediction cache is recreated (empty) on load, like the
+        # function caches
+        dc.pop('_pred_cache', None)
+        return dc
 
     def to_dict(self, save_data=True):
         """
@@ -197,6 +221,23 @@ class GP(Model):
     def _predictive_variable(self):
         return self.X
 
+    @property
+    def compute_dtype(self):
+        """
+        Floating point type used for the predictive variance computation.
+
+        This is only honoured by exact Gaussian posteriors; other posteriors
+        (sparse, EP, ...) ignore it and always predict in double precision.
+        """
+        return self._compute_dtype
+
+    @compute_dtype.setter
+    def compute_dtype(self, dtype):
+        self._compute_dtype = np.dtype(dtype)
+        if self.posterior is not None:
+            self.posterior.compute_dtype = self._compute_dtype
+        self._pred_cache = {}
+
     @property
     def num_data(self):
         return self.X.shape[0]
@@ -272,6 +313,8 @@ class GP(Model):
             this method yourself, there may be unexpected consequences.
         """
         self.posterior, self._log_marginal_likelihood, self.grad_dict = self.inference_method.inference(self.kern, self.X, self.likelihood, self.Y_normalized, self.mean_function, self.Y_metadata)
+        self.posterior.compute_dtype = self.compute_dtype
+        self._pred_cache = {}
         self.likelihood.update_gradients(self.grad_dict['dL_dthetaL'])
         self.kern.update_gradients_full(self.grad_dict['dL_dK'], self.X)
         if self.mean_function is not None:
@@ -295,12 +338,43 @@ class GP(Model):
             p(f*|X*, X, Y) = \int^{\inf}_{\inf} p(f*|f,X*)p(f|X,Y) df
                         = N(f*| K_{x*x}(K_{xx} + \Sigma)^{-1}Y, K_{x*x*} - K_{xx*}(K_{xx} + \Sigma)^{-1}K_{xx*}
             \Sigma := \texttt{Likelihood.variance / Approximate likelihood covariance}
+
+        Marginal predictions with the model kernel are cached per posterior,
+        so that consecutive calls on the same Xnew (e.g. predict() followed by
+        predict_quantiles() while plotting) do not recompute the kernel
+        matrices. Full covariance predictions are not cached, as that would
+        keep an Nnew x Nnew array alive until the posterior changes.
         """
-        mu, var = self.posterior._raw_predict(kern=self.kern if kern is None else kern, Xnew=Xnew, pred_var=self._predictive_variable, full_cov=full_cov)
+        if kern is None and not full_cov and not isinstance(Xnew, VariationalPosterior):
+            mu, var = self._cached_raw_predict(Xnew)
+        else:
+            mu, var = self.posterior._raw_predict(kern=self.kern if kern is None else kern, Xnew=Xnew, pred_var=self._predictive_variable, full_cov=full_cov)
         if self.mean_function is not None:
             mu += self.mean_function.f(Xnew)
         return mu, var
 
+    def _cached_raw_predict(self, Xnew):
+        """
+        Marginal posterior prediction with the model kernel, reusing the
+        result of the last call with the same Xnew for the current posterior.
+
+        The cache is keyed on the posterior object, so it is invalidated
+        whenever the posterior is recomputed (see parameters_changed).
+        """
+        cache = getattr(self, '_pred_cache', None)
+        if cache is None:
+            cache = self._pred_cache = {}
+        if cache.get('posterior') is not self.posterior:
+            cache.clear()
+            cache['posterior'] = self.posterior
+        Xnew_arr = np.asarray(Xnew)
+        last = cache.get('diag')
+        if last is not None and last[0].shape == Xnew_arr.shape and np.array_equal(last[0], Xnew_arr):
+            return last[1].copy(), last[2].copy()
+        mu, var = self.posterior._raw_predict(kern=self.kern, Xnew=Xnew, pred_var=self._predictive_variable, full_cov=False)
+        cache['diag'] = (Xnew_arr.copy(), mu.copy(), var.copy())
+        return mu, var
+
     def predict(self, Xnew, full_cov=False, Y_metadata=None, kern=None,
                 likelihood=None, include_likelihood=True):
         """
@@ -501,10 +575,13 @@ class GP(Model):
         for i in range(self.output_dim):
             mean_jac[:,:,i] = kern.gradients_X(self.posterior.woodbury_vector[:,i:i+1].T, Xnew, self._predictive_variable)
 
-        dK_dXnew_full = np.empty((self._predictive_variable.shape[0], Xnew.shape[0], Xnew.shape[1]))
+        # plain ndarray view of the inputs, so that taking the rows one by one
+        # does not go through the observable array indexing
+        pred_var = self._predictive_variable.view(np.ndarray)
+        dK_dXnew_full = np.empty((pred_var.shape[0], Xnew.shape[0], Xnew.shape[1]))
         one = np.ones((1,1))
-        for i in range(self._predictive_variable.shape[0]):
-            dK_dXnew_full[i] = kern.gradients_X(one, Xnew, self._predictive_variable[[i]])
+        for i in range(pred_var.shape[0]):
+            dK_dXnew_full[i] = kern.gradients_X(one, Xnew, pred_var[i:i+1])
 
         if full_cov:
             dK2_dXdX = kern.gradients_XX(one, Xnew)
@@ -585,7 +662,6 @@ class GP(Model):
         if dimensions is None:
             dimensions = self.get_most_significant_input_dimensions()[:2]
         G = G[:, dimensions][:,:,dimensions]
-        from ..util.linalg import jitchol
         mag = np.empty(Xnew.shape[0])
         for n in range(Xnew.shape[0]):
             try:
@@ -594,7 +670,7 @@ class GP(Model):
                 mag[n] = np.sqrt(np.linalg.det(G[n, :, :]))
         return mag
 
-    def posterior_samples_f(self,X, size=10, **predict_kwargs):
+    def posterior_samples_f(self,X, size=10, full_cov=True, **predict_kwargs):
         """
         Samples the posterior GP at the points X.
 
@@ -602,28 +678,69 @@ class GP(Model):
         :type X: np.ndarray (Nnew x self.input_dim)
         :param size: the number of a posteriori samples.
         :type size: int.
+        :param full_cov: whether to sample jointly from the full covariance
+                         (default), or independently from the marginals.
+        :type full_cov: bool.
         :returns: set of simulations
         :rtype: np.ndarray (Nnew x D x samples)
         """
-        predict_kwargs["full_cov"] = True  # Always use the full covariance for posterior samples.
-        m, v = self._raw_predict(X,  **predict_kwargs)
+        m, v = self._raw_predict(X, full_cov=full_cov, **predict_kwargs)
         if self.normalizer is not None:
             m, v = self.normalizer.inverse_mean(m), self.normalizer.inverse_variance(v)
 
-        def sim_one_dim(m, v):
-            return np.random.multivariate_normal(m, v, size).T
+        if (full_cov and not predict_kwargs and not isinstance(X, VariationalPosterior)
+                and X.shape[0] <= self.sample_chol_cache_max_points):
+            chols = self._sample_chol_cache(X)
+        else:
+            chols = {}
+
+        def sim_one_dim(m, v, key=None):
+            z = np.random.standard_normal((m.size, size))
+            if not full_cov:
+                return m[:, None] + np.sqrt(v)[:, None] * z
+            if key not in chols:
+                try:
+                    chols[key] = jitchol(v)
+                except np.linalg.LinAlgError:
+                    chols[key] = None
+            L = chols[key]
+            if L is None:
+                # not numerically PD, let numpy deal with it via the SVD
+                return np.random.multivariate_normal(m, v, size).T
+            return m[:, None] + np.dot(L, z)
 
         if self.output_dim == 1:
-            return sim_one_dim(m.flatten(), v)[:, np.newaxis, :]
+            return sim_one_dim(m.ravel(), v if full_cov else v.ravel())[:, np.newaxis, :]
         else:
             fsim = np.empty((X.shape[0], self.output_dim, size))
             for d in range(self.output_dim):
-                if v.ndim == 3:
-                    fsim[:, d, :] = sim_one_dim(m[:, d], v[:, :, d])
-                else:
+                if full_cov and v.ndim == 3:
+                    fsim[:, d, :] = sim_one_dim(m[:, d], v[:, :, d], d)
+                elif full_cov:
                     fsim[:, d, :] = sim_one_dim(m[:, d], v)
+                else:
+                    fsim[:, d, :] = sim_one_dim(m[:, d], v[:, d] if v.shape[1] > 1 else v[:, 0])
         return fsim
 
+    def _sample_chol_cache(self, X):
+        """
+        Dictionary of the Cholesky factors of the full predictive covariance
+        at X, so that repeated calls to posterior_samples_f on the same points
+        only factorise it once.
+
+        Like the prediction cache, this is keyed on the posterior object, so
+        the factors are dropped whenever the posterior is recomputed.
+        """
+        cache = getattr(self, '_pred_cache', None)
+        if cache is None:
+            cache = self._pred_cache = {}
+        X_arr = np.asarray(X)
+        last = cache.get('sample_chol')
+        if (last is None or last[0] is not self.posterior or last[1].shape != X_arr.shape
+                or not np.array_equal(last[1], X_arr)):
+            last = cache['sample_chol'] = (self.posterior, X_arr.copy(), {})
+        return last[2]
+
     def posterior_samples(self, X, size=10, Y_metadata=None, likelihood=None, **predict_kwargs):
         """
         Samples the posterior GP at the points X.
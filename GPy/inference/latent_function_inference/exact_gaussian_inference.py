@@ -2,7 +2,7 @@
 # Licensed under the BSD 3-clause license (see LICENSE.txt)
 
 from .posterior import PosteriorExact as Posterior
-from ...util.linalg import pdinv, dpotrs, tdot
+from ...util.linalg import jitchol, dpotri, dpotrs, tdot
 from ...util import diag
 import numpy as np
 from . import LatentFunctionInference
@@ -52,10 +52,13 @@ class ExactGaussianInference(LatentFunctionInference):
         if K is None:
             K = kern.K(X)
 
-        Ky = K.copy()
+        # Fortran ordered copy of K, which is factorised in place
+        Ky = np.array(K, order='F')
         diag.add(Ky, variance+1e-8)
 
-        Wi, LW, LWi, W_logdet = pdinv(Ky)
+        LW = jitchol(Ky, overwrite_A=True)
+        W_logdet = 2.*np.sum(np.log(np.diag(LW)))
+        Wi, _ = dpotri(LW, lower=1)
 
         alpha, _ = dpotrs(LW, YYT_factor, lower=1)
 
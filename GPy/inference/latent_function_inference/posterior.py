@@ -2,7 +2,7 @@
 # Licensed under the BSD 3-clause license (see LICENSE.txt)
 
 import numpy as np
-from ...util.linalg import pdinv, dpotrs, dpotri, symmetrify, jitchol, dtrtrs, tdot
+from ...util.linalg import pdinv, dpotrs, dpotri, symmetrify, jitchol, dtrtrs, dtrsm, tdot, schur_complement
 from GPy.core.parameterization.variational import VariationalPosterior
 
 
@@ -75,6 +75,7 @@ class Posterior(object):
 
         # compute this lazily
         self._precision = None
+        self._woodbury_chol_compute = None
 
     @property
     def mean(self):
@@ -271,34 +272,85 @@ class Posterior(object):
 
 
 class PosteriorExact(Posterior):
+    # Floating point type of the triangular solve and the rank-k update in
+    # _raw_predict. Setting this to np.float32 halves the memory traffic of
+    # the (memory bound) variance computation, at the cost of roughly seven
+    # significant digits in the predictive variance.
+    compute_dtype = np.float64
+
+    # Number of test points processed at once in diagonal predictions. This
+    # bounds the N x Nnew temporaries of the solve by N x predict_tile_size.
+    predict_tile_size = 1024
+
+    @property
+    def woodbury_chol_compute(self):
+        """
+        The woodbury Cholesky factor in compute_dtype, converted lazily.
+        """
+        if self._woodbury_chol.dtype == self.compute_dtype:
+            return self._woodbury_chol
+        if self._woodbury_chol_compute is None or self._woodbury_chol_compute.dtype != self.compute_dtype:
+            self._woodbury_chol_compute = np.asfortranarray(self._woodbury_chol, dtype=self.compute_dtype)
+        return self._woodbury_chol_compute
+
     def _raw_predict(self, kern, Xnew, pred_var, full_cov=False):
+        if not full_cov:
+            return self._raw_predict_diag(kern, Xnew, pred_var)
 
-        Kx = kern.K(pred_var, Xnew)
+        # the transpose of K(Xnew, X) is Fortran ordered, which is what the
+        # triangular solve copies into, so that copy needs no transposition
+        Kx = kern.K(Xnew, pred_var).T
         mu = np.dot(Kx.T, self.woodbury_vector)
         if len(mu.shape) == 1:
             mu = mu.reshape(-1, 1)
-        if full_cov:
-            Kxx = kern.K(Xnew)
-            if self._woodbury_chol.ndim == 2:
-                tmp = dtrtrs(self._woodbury_chol, Kx)[0]
-                var = Kxx - tdot(tmp.T)
-            elif self._woodbury_chol.ndim == 3:  # Missing data
-                var = np.empty((Kxx.shape[0], Kxx.shape[1], self._woodbury_chol.shape[2]))
-                for i in range(var.shape[2]):
-                    tmp = dtrtrs(self._woodbury_chol[:, :, i], Kx)[0]
-                    var[:, :, i] = (Kxx - tdot(tmp.T))
-            var = var
+        woodbury_chol = self.woodbury_chol_compute
+        Kxx = kern.K(Xnew).astype(woodbury_chol.dtype, copy=False)
+        if woodbury_chol.ndim == 2:
+            var = schur_complement(woodbury_chol, Kx, Kxx).astype(np.float64, copy=False)
+        elif woodbury_chol.ndim == 3:  # Missing data
+            var = np.empty((Kxx.shape[0], Kxx.shape[1], woodbury_chol.shape[2]))
+            for i in range(var.shape[2]):
+                var[:, :, i] = schur_complement(woodbury_chol[:, :, i], Kx, Kxx)
+        return mu, var
+
+    def _raw_predict_diag(self, kern, Xnew, pred_var):
+        """
+        Predictive mean and marginal variances, computed in tiles of
+        predict_tile_size test points.
+        """
+        woodbury_vector = np.asarray(self.woodbury_vector, dtype=np.float64)
+        if woodbury_vector.ndim == 1:
+            woodbury_vector = woodbury_vector[:, None]
+        woodbury_chol = self.woodbury_chol_compute
+        num_new = Xnew.shape[0]
+        mu = np.empty((num_new, woodbury_vector.shape[1]))
+        if woodbury_chol.ndim == 2:
+            var = np.empty((num_new, 1))
+        else:  # Missing data
+            var = np.empty((num_new, woodbury_chol.shape[2]))
+
+        if kern._constant_Kdiag and num_new > 0:
+            # stationary prior variance, no need to evaluate it per point
+            Kdiag = np.full(num_new, kern.Kdiag(Xnew[:1])[0])
         else:
-            Kxx = kern.Kdiag(Xnew)
-            if self._woodbury_chol.ndim == 2:
-                tmp = dtrtrs(self._woodbury_chol, Kx)[0]
-                var = (Kxx - np.square(tmp).sum(0))[:, None]
-            elif self._woodbury_chol.ndim == 3:  # Missing data
-                var = np.empty((Kxx.shape[0], self._woodbury_chol.shape[2]))
-                for i in range(var.shape[1]):
-                    tmp = dtrtrs(self._woodbury_chol[:, :, i], Kx)[0]
-                    var[:, i] = (Kxx - np.square(tmp).sum(0))
-            var = var
+            Kdiag = None
+
+        for start in range(0, num_new, self.predict_tile_size):
+            tile = slice(start, start + self.predict_tile_size)
+            Kx = kern.K(Xnew[tile], pred_var).T  # Fortran ordered, see _raw_predict
+            # write straight into the (contiguous) output rows
+            np.dot(Kx.T, woodbury_vector, out=mu[tile])
+            Kxx = kern.Kdiag(Xnew[tile]) if Kdiag is None else Kdiag[tile]
+            for i in range(var.shape[1]):
+                L = woodbury_chol if woodbury_chol.ndim == 2 else woodbury_chol[:, :, i]
+                tmp = dtrsm(L, Kx)
+                var_i = var[tile, i]
+                np.einsum('ij,ij->j', tmp, tmp, out=var_i)
+                np.subtract(Kxx, var_i, out=var_i)
+
+        if woodbury_chol.dtype != np.float64:
+            # cancellation in low precision can push small variances below zero
+            var = np.clip(var, 1e-15, np.inf)
         return mu, var
 
 
@@ -118,8 +118,10 @@ class VarDTC_MD(LatentFunctionInference):
         dL_dpsi2R_common = dpotri(LmLL)[0]/-2.
         dL_dpsi2 += dL_dpsi2R_common[None,:,:]*beta_exp[:,None,None]
 
-        for d in range(output_dim):
-            dL_dthetaL[d] += (dL_dpsi2R_common*psi2[indexD==d].sum(0)).sum()*-beta[d]*beta[d]
+        # contract every data point against the common term once and sum the
+        # results per output, instead of masking psi2 for each output
+        psi2R_common = np.einsum('nij,ij->n', psi2, dL_dpsi2R_common)
+        dL_dthetaL += np.bincount(indexD.astype(int), weights=psi2R_common, minlength=output_dim)*-np.square(beta)
 
         dL_dKmm += dL_dpsi2R_common*output_dim
 
@@ -154,7 +156,7 @@ class VarDTC_MD(LatentFunctionInference):
         #======================================================================
 
         if not uncertain_inputs:
-            dL_dpsi1 += (psi1[:,None,:]*dL_dpsi2).sum(2)*2.
+            dL_dpsi1 += np.einsum('nm,nkm->nk', psi1, dL_dpsi2)*2.
 
         if uncertain_inputs:
             grad_dict = {'dL_dKmm': dL_dKmm,
@@ -70,6 +70,10 @@ class Add(CombinationKernel):
             which_parts = [which_parts]
         return reduce(np.add, (p.K(X, X2) for p in which_parts))
 
+    @property
+    def _constant_Kdiag(self):
+        return all(p._constant_Kdiag for p in self.parts)
+
     @Cache_this(limit=3, force_kwargs=['which_parts'])
     def Kdiag(self, X, which_parts=None):
         if which_parts is None:
@@ -9,6 +9,13 @@ from ...core import Param
 from paramz.caching import Cache_this
 from paramz.transformations import Logexp
 from .grid_kerns import GridRBF
+from ...util.config import config # for assesing whether to use numba
+
+try:
+    from . import rbf_numba
+    use_rbf_numba = config.getboolean('numba', 'working')
+except ImportError:
+    use_rbf_numba = False
 
 class RBF(Stationary):
     """
@@ -48,6 +55,28 @@ class RBF(Stationary):
             input_dict["lengthscale"] = np.sqrt(1 / float(self.inv_l))
         return input_dict
 
+    @Cache_this(limit=3, ignore_args=())
+    def K(self, X, X2=None):
+        if use_rbf_numba:
+            return self._K_numba(X, X2)
+        else:
+            return self._K_numpy(X, X2)
+
+    def _K_numpy(self, X, X2=None):
+        return self.K_of_r(self._scaled_dist(X, X2))
+
+    def _K_numba(self, X, X2=None):
+        variance = float(self.variance)
+        X = np.ascontiguousarray(X / self.lengthscale.values, dtype=np.float64)
+        if X2 is None:
+            K = np.empty((X.shape[0], X.shape[0]))
+            rbf_numba.K_symmetric(X, variance, K)
+        else:
+            X2 = np.ascontiguousarray(X2 / self.lengthscale.values, dtype=np.float64)
+            K = np.empty((X.shape[0], X2.shape[0]))
+            rbf_numba.K_cross(X, X2, variance, K)
+        return K
+
     def K_of_r(self, r):
         return self.variance * np.exp(-0.5 * r**2)
 
@@ -0,0 +1,36 @@
+# Copyright (c) 2012, GPy authors (see AUTHORS.txt).
+# Licensed under the BSD 3-clause license (see LICENSE.txt)
+
+# Numba versions of the RBF covariance assembly. The inputs are expected to be
+# divided by the lengthscale(s) already, so the same code serves ARD and
+# non-ARD kernels.
+
+import math
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def K_symmetric(X, variance, K):
+    N, D = X.shape
+    for i in prange(N):
+        for j in range(i, N):
+            s = 0.
+            for d in range(D):
+                t = X[i, d] - X[j, d]
+                s += t*t
+            v = variance*math.exp(-.5*s)
+            K[i, j] = v
+            K[j, i] = v
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def K_cross(X, X2, variance, K):
+    N, D = X.shape
+    M = X2.shape[0]
+    for i in prange(N):
+        for j in range(M):
+            s = 0.
+            for d in range(D):
+                t = X[i, d] - X2[j, d]
+                s += t*t
+            K[i, j] = variance*math.exp(-.5*s)
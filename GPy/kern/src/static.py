@@ -9,6 +9,8 @@ from paramz.transformations import Logexp
 from paramz.caching import Cache_this
 
 class Static(Kern):
+    _constant_Kdiag = True
+
     def __init__(self, input_dim, variance, active_dims, name):
         super(Static, self).__init__(input_dim, active_dims, name)
         self.variance = Param('variance', variance, Logexp())
@@ -94,6 +96,8 @@ class White(Static):
         self.variance.gradient = dL_dpsi0.sum()
 
 class WhiteHeteroscedastic(Static):
+    _constant_Kdiag = False
+
     def __init__(self, input_dim, num_data, variance=1., active_dims=None, name='white_hetero'):
         """
         A heteroscedastic White kernel (nugget/noise).
@@ -184,6 +188,8 @@ class Bias(Static):
                                     + 2.*self.variance*dL_dpsi2.sum())
 
 class Fixed(Static):
+    _constant_Kdiag = False
+
     def __init__(self, input_dim, covariance_matrix, variance=1., active_dims=None, name='fixed'):
         """
         :param input_dim: the number of input dimensions
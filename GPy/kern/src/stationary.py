@@ -58,6 +58,8 @@ class Stationary(Kern):
     The more common version of stationarity is that the covariance is a function of x_1 - x_2 (See e.g. R&W first paragraph of section 4.1).
     """
 
+    _constant_Kdiag = True
+
     def __init__(self, input_dim, variance, lengthscale, ARD, active_dims, name, useGPU=False):
         super(Stationary, self).__init__(input_dim, active_dims, name,useGPU=useGPU)
         self.ARD = ARD
@@ -127,23 +129,39 @@ class Stationary(Kern):
         #a convenience function, so we can cache dK_dr
         return self.dK2_drdr(self._scaled_dist(X, X2))
 
-    def _unscaled_dist(self, X, X2=None):
+    @Cache_this(limit=3, ignore_args=())
+    def _sq_norms(self, X):
+        """
+        Squared norm of each row of X, in the coordinates used by
+        _unscaled_dist (i.e. divided by the lengthscales for ARD kernels).
+
+        This is cached so that the norms of the training inputs are shared
+        between K(X), K(X, Xnew) and the gradient computations.
+        """
+        if self.ARD:
+            return np.dot(np.square(X), 1./np.square(self.lengthscale.values))
+        return np.einsum('ij,ij->i', X, X)
+
+    def _unscaled_dist(self, X, X2=None, Xsq=None, X2sq=None):
         """
         Compute the Euclidean distance between each row of X and X2, or between
         each pair of rows of X if X2 is None.
+
+        Xsq and X2sq are the (optional) precomputed squared row norms of X and X2.
         """
         #X, = self._slice_X(X)
+        if Xsq is None:
+            Xsq = np.einsum('ij,ij->i', X, X)
         if X2 is None:
-            Xsq = np.sum(np.square(X),1)
             r2 = -2.*tdot(X) + (Xsq[:,None] + Xsq[None,:])
             util.diag.view(r2)[:,]= 0. # force diagnoal to be zero: sometime numerically a little negative
             r2 = np.clip(r2, 0, np.inf)
             return np.sqrt(r2)
         else:
             #X2, = self._slice_X(X2)
-            X1sq = np.sum(np.square(X),1)
-            X2sq = np.sum(np.square(X2),1)
-            r2 = -2.*np.dot(X, X2.T) + (X1sq[:,None] + X2sq[None,:])
+            if X2sq is None:
+                X2sq = np.einsum('ij,ij->i', X2, X2)
+            r2 = -2.*np.dot(X, X2.T) + (Xsq[:,None] + X2sq[None,:])
             r2 = np.clip(r2, 0, np.inf)
             return np.sqrt(r2)
 
@@ -160,12 +178,14 @@ class Stationary(Kern):
         function for caching) and divide by lengthscale afterwards
 
         """
+        Xsq = self._sq_norms(X)
+        X2sq = None if X2 is None else self._sq_norms(X2)
         if self.ARD:
             if X2 is not None:
                 X2 = X2 / self.lengthscale
-            return self._unscaled_dist(X/self.lengthscale, X2)
+            return self._unscaled_dist(X/self.lengthscale, X2, Xsq, X2sq)
         else:
-            return self._unscaled_dist(X, X2)/self.lengthscale
+            return self._unscaled_dist(X, X2, Xsq, X2sq)/self.lengthscale
 
     def Kdiag(self, X):
         ret = np.empty(X.shape[0])
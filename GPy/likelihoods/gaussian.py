@@ -116,7 +116,8 @@ class Gaussian(Likelihood):
         return self.variance + sigma**2
 
     def predictive_quantiles(self, mu, var, quantiles, Y_metadata=None):
-        return  [stats.norm.ppf(q/100.)*np.sqrt(var + self.variance) + mu for q in quantiles]
+        sd = np.sqrt(var + self.variance)
+        return  [stats.norm.ppf(q/100.)*sd + mu for q in quantiles]
 
     def pdf_link(self, link_f, y, Y_metadata=None):
         """
@@ -319,12 +320,10 @@ class Gaussian(Likelihood):
 
         :param gp: latent variable
         """
-        orig_shape = gp.shape
-        gp = gp.flatten()
-        #orig_shape = gp.shape
-        gp = gp.flatten()
-        Ysim = np.array([np.random.normal(self.gp_link.transf(gpj), scale=np.sqrt(self.variance), size=1) for gpj in gp])
-        return Ysim.reshape(orig_shape)
+        # draw, scale and shift the noise in a single buffer
+        noise = np.random.standard_normal(gp.shape)
+        np.multiply(noise, np.sqrt(self.variance), out=noise)
+        return np.add(self.gp_link.transf(gp), noise, out=noise)
 
     def log_predictive_density(self, y_test, mu_star, var_star, Y_metadata=None):
         """
@@ -374,4 +373,5 @@ class HeteroscedasticGaussian(Gaussian):
 
     def predictive_quantiles(self, mu, var, quantiles, Y_metadata=None):
         _s = self.variance[Y_metadata['output_index'].flatten()]
-        return  [stats.norm.ppf(q/100.)*np.sqrt(var + _s) + mu for q in quantiles]
+        sd = np.sqrt(var + _s)
+        return  [stats.norm.ppf(q/100.)*sd + mu for q in quantiles]
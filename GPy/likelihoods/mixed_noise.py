@@ -74,9 +74,5 @@ class MixedNoise(Likelihood):
         ind = Y_metadata['output_index'].flatten()
         for j in np.unique(ind):
             flt = ind==j
-            gp_filtered = gp[flt,:]
-            n1 = gp_filtered.shape[0]
-            lik = self.likelihoods_list[j]
-            _ysim = np.array([np.random.normal(lik.gp_link.transf(gpj), scale=np.sqrt(lik.variance), size=1) for gpj in gp_filtered.flatten()])
-            Ysim[flt,:] = _ysim.reshape(n1,N2)
+            Ysim[flt,:] = self.likelihoods_list[j].samples(gp[flt,:])
         return Ysim
@@ -275,8 +275,10 @@ class TPRegression(Model):
 
         def sim_one_dim(m, v):
             nu = self.nu + 2 + self.num_data
-            v = np.diag(v.flatten()) if not full_cov else v
-            Z = np.random.multivariate_normal(np.zeros(X.shape[0]), v, size).T
+            if full_cov:
+                Z = np.random.multivariate_normal(np.zeros(X.shape[0]), v, size).T
+            else:
+                Z = np.sqrt(v.reshape(-1, 1)) * np.random.standard_normal((X.shape[0], size))
             g = np.tile(np.random.gamma(nu / 2., 2. / nu, size), (X.shape[0], 1))
             return m + Z / np.sqrt(g)
 
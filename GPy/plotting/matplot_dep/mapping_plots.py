@@ -57,8 +57,12 @@ def plot_mapping(self, plot_limits=None, which_data='all', which_parts='all', re
 
         Xu = self.X * self._Xscale + self._Xoffset # NOTE self.X are the normalized values now
 
-        fixed_dims = np.array([i for i,v in fixed_inputs])
-        freedim = np.setdiff1d(np.arange(self.input_dim),fixed_dims)
+        if len(fixed_inputs) == 0:
+            freedim = np.arange(self.input_dim)
+        else:
+            free = np.ones(self.input_dim, dtype=bool)
+            free[[i for i,v in fixed_inputs]] = False
+            freedim = np.nonzero(free)[0]
 
         Xnew, xmin, xmax = x_frame1D(Xu[:,freedim], plot_limits=plot_limits)
         Xgrid = np.empty((Xnew.shape[0],self.input_dim))
@@ -19,6 +19,12 @@ try:
 except ImportError:
     cython_coregionalize_working = False
 
+try:
+    from ..kern.src import rbf_numba
+    numba_rbf_working = config.getboolean('numba', 'working')
+except ImportError:
+    numba_rbf_working = False
+
 
 class Kern_check_model(GPy.core.Model):
     """
@@ -588,6 +594,23 @@ class KernelTestsMiscellaneous(unittest.TestCase):
         np.testing.assert_array_equal(tmp.active_dims, [0,1,2,3,7,9])
         np.testing.assert_array_equal(tmp._all_dims_active, range(10))
 
+    def test_constant_Kdiag(self):
+        white = GPy.kern.White(10)
+        for k in [self.rbf, self.matern, white, self.matern+self.rbf, self.matern*self.rbf+white]:
+            self.assertTrue(k._constant_Kdiag)
+            np.testing.assert_allclose(k.Kdiag(self.X), k.Kdiag(self.X[:1])[0])
+        for k in [self.linear, self.sumkern, self.matern*self.linear]:
+            self.assertFalse(k._constant_Kdiag)
+
+    def test_scaled_dist(self):
+        from scipy.spatial.distance import cdist
+        X2 = np.random.randn(7, self.X.shape[1])
+        for k in [GPy.kern.RBF(self.X.shape[1], lengthscale=1.3),
+                  GPy.kern.RBF(self.X.shape[1], lengthscale=np.random.uniform(.5, 2., self.X.shape[1]), ARD=True)]:
+            l = k.lengthscale.values
+            np.testing.assert_allclose(k._scaled_dist(self.X), cdist(self.X/l, self.X/l), atol=1e-7)
+            np.testing.assert_allclose(k._scaled_dist(self.X, X2), cdist(self.X/l, X2/l), atol=1e-7)
+
 class KernelTestsNonContinuous(unittest.TestCase):
     def setUp(self):
         N0 = 3
@@ -694,6 +717,28 @@ class Coregionalize_cython_test(unittest.TestCase):
 
 
 
+@unittest.skipIf(not numba_rbf_working,"numba is not installed on this machine")
+class RBF_numba_test(unittest.TestCase):
+    """
+    Make sure that the RBF kernel gives the same covariance with and without numba
+    """
+    def setUp(self):
+        self.N1, self.N2 = 100, 200
+        self.X = np.random.randn(self.N1, 3)
+        self.X2 = np.random.randn(self.N2, 3)
+
+    def test_sym(self):
+        for ARD in [False, True]:
+            k = GPy.kern.RBF(3, variance=1.5, lengthscale=[.5, 1., 2.] if ARD else .7, ARD=ARD)
+            np.testing.assert_allclose(k._K_numpy(self.X), k._K_numba(self.X))
+
+    def test_nonsym(self):
+        for ARD in [False, True]:
+            k = GPy.kern.RBF(3, variance=1.5, lengthscale=[.5, 1., 2.] if ARD else .7, ARD=ARD)
+            np.testing.assert_allclose(k._K_numpy(self.X, self.X2), k._K_numba(self.X, self.X2))
+
+
+
 class KernelTestsProductWithZeroValues(unittest.TestCase):
 
     def setUp(self):
@@ -1,6 +1,6 @@
 import numpy as np
 import scipy as sp
-from ..util.linalg import jitchol,trace_dot, ijk_jlk_to_il, ijk_ljk_to_ilk
+from ..util.linalg import jitchol,trace_dot, ijk_jlk_to_il, ijk_ljk_to_ilk, DSYRK_blas, DSYRK_numpy, dtrtrs, dtrsm
 
 class LinalgTests(np.testing.TestCase):
     def setUp(self):
@@ -25,6 +25,18 @@ class LinalgTests(np.testing.TestCase):
         diff = A_new - self.A_corrupt
         np.testing.assert_allclose(diff, np.eye(A_new.shape[0])*np.diag(diff).mean(), atol=1e-13)
 
+    def test_jitchol_overwrite(self):
+        L = jitchol(self.A)
+        A = np.asfortranarray(self.A)
+        L_inplace = jitchol(A, overwrite_A=True)
+        self.assertTrue(np.shares_memory(A, L_inplace))
+        np.testing.assert_allclose(L_inplace, L)
+        # the not pd case has to recover the input for the jitter
+        A = np.asfortranarray(self.A_corrupt)
+        L = jitchol(A, maxtries=5, overwrite_A=True)
+        diff = L.dot(L.T) - self.A_corrupt
+        np.testing.assert_allclose(diff, np.eye(L.shape[0])*np.diag(diff).mean(), atol=1e-13)
+
     def test_jitchol_failure(self):
         try:
             """
@@ -58,3 +70,33 @@ class LinalgTests(np.testing.TestCase):
         pure = np.einsum('ijk,ljk->ilk', A, B)
         quick = ijk_ljk_to_ilk(A,B)
         np.testing.assert_allclose(pure, quick)
+
+    def test_dsyrk(self):
+        A = np.random.randn(30, 20)
+        C = self.A.copy()
+        pure = DSYRK_numpy(self.A, A, alpha=-1.)
+        quick = DSYRK_blas(self.A, A, alpha=-1.)
+        np.testing.assert_allclose(pure, quick)
+        np.testing.assert_array_equal(C, self.A)
+
+    def test_dtrsm(self):
+        L = jitchol(self.A)
+        B = np.random.randn(20, 7)
+        B_copy = B.copy()
+        np.testing.assert_allclose(dtrtrs(L, B)[0], dtrsm(L, B))
+        np.testing.assert_allclose(dtrtrs(L, B, trans=1)[0], dtrsm(L, B, trans=1))
+        np.testing.assert_array_equal(B, B_copy)
+
+    def test_schur_complement(self):
+        from ..util import linalg
+        L = jitchol(self.A)
+        Kx = np.random.randn(20, 7)
+        Kxx = np.random.randn(7, 7)
+        Kxx = Kxx + Kxx.T
+        Kx_copy, Kxx_copy = Kx.copy(), Kxx.copy()
+        expected = Kxx - Kx.T.dot(np.linalg.solve(self.A, Kx))
+        np.testing.assert_allclose(linalg._schur_complement_numpy(L, Kx, Kxx), expected, atol=1e-10)
+        if linalg.use_linalg_cython and hasattr(linalg.linalg_cython, 'schur_complement'):
+            np.testing.assert_allclose(linalg._schur_complement_cython(L, Kx, Kxx), expected, atol=1e-10)
+        np.testing.assert_array_equal(Kx, Kx_copy)
+        np.testing.assert_array_equal(Kxx, Kxx_copy)
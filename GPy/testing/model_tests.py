@@ -81,6 +81,87 @@ class MiscTests(unittest.TestCase):
         np.testing.assert_almost_equal(np.diag(K_hat)[:, None], var)
         np.testing.assert_almost_equal(mu_hat, mu)
 
+    def test_raw_predict_cache(self):
+        m = GPy.models.GPRegression(self.X, self.Y)
+        mu1, var1 = m._raw_predict(self.X_new)
+        mu1 += 1.
+        mu2, var2 = m._raw_predict(self.X_new)
+        np.testing.assert_allclose(mu1 - 1., mu2)
+        np.testing.assert_allclose(var1, var2)
+
+        m.kern.lengthscale = 2.
+        mu3, var3 = m._raw_predict(self.X_new)
+        mu_hat, var_hat = m.posterior._raw_predict(m.kern, self.X_new, m.X)
+        np.testing.assert_allclose(mu_hat, mu3)
+        np.testing.assert_allclose(var_hat, var3)
+        self.assertFalse(np.allclose(var2, var3))
+
+        m._raw_predict(self.X_new, full_cov=True)
+        self.assertEqual(sorted(k for k in m._pred_cache if k != 'posterior'), ['diag'])
+
+    def test_raw_predict_cache_not_pickled(self):
+        import pickle
+        m = GPy.models.GPRegression(self.X, self.Y)
+        mu, var = m.predict(self.X_new)
+        self.assertNotIn('_pred_cache', m.__getstate__())
+        m2 = pickle.loads(pickle.dumps(m))
+        mu2, var2 = m2.predict(self.X_new)
+        np.testing.assert_allclose(mu, mu2)
+        np.testing.assert_allclose(var, var2)
+
+    def test_raw_predict_compute_dtype(self):
+        m = GPy.models.GPRegression(self.X, self.Y)
+        mu, covar = m._raw_predict(self.X_new, full_cov=True)
+        _, var = m._raw_predict(self.X_new)
+        m.compute_dtype = np.float32
+        mu32, covar32 = m._raw_predict(self.X_new, full_cov=True)
+        _, var32 = m._raw_predict(self.X_new)
+        np.testing.assert_allclose(mu, mu32)
+        np.testing.assert_allclose(covar, covar32, atol=1e-5)
+        np.testing.assert_allclose(var, var32, atol=1e-5)
+
+    def test_unpickle_without_compute_dtype(self):
+        # state of a model pickled before compute_dtype existed
+        m = GPy.models.GPRegression(self.X, self.Y)
+        state = m.__getstate__()
+        del state['_compute_dtype']
+        m2 = GPy.models.GPRegression.__new__(GPy.models.GPRegression)
+        m2.__setstate__(state)
+        self.assertEqual(m2.compute_dtype, np.float64)
+        np.testing.assert_allclose(m2.predict(self.X_new)[1], m.predict(self.X_new)[1])
+
+    def test_raw_predict_tiled(self):
+        m = GPy.models.GPRegression(self.X, self.Y)
+        mu, var = m.posterior._raw_predict(m.kern, self.X_new, m.X)
+        m.posterior.predict_tile_size = 7
+        mu_tiled, var_tiled = m.posterior._raw_predict(m.kern, self.X_new, m.X)
+        np.testing.assert_allclose(mu, mu_tiled)
+        np.testing.assert_allclose(var, var_tiled)
+
+    def test_posterior_samples_f(self):
+        m = GPy.models.GPRegression(self.X, self.Y)
+        mu, var = m.predict_noiseless(self.X_new[:5])
+        for full_cov in [True, False]:
+            fsim = m.posterior_samples_f(self.X_new[:5], size=20000, full_cov=full_cov)
+            self.assertEqual(fsim.shape, (5, self.D, 20000))
+            np.testing.assert_allclose(fsim.mean(-1), mu, atol=.05)
+            np.testing.assert_allclose(fsim.var(-1), var, atol=.05)
+
+    def test_posterior_samples_f_cache(self):
+        m = GPy.models.GPRegression(self.X, self.Y)
+        X_new = self.X_new[:5]
+        np.random.seed(3)
+        fsim = m.posterior_samples_f(X_new, size=10)
+        L = m._sample_chol_cache(X_new)[None]
+        np.random.seed(3)
+        np.testing.assert_allclose(m.posterior_samples_f(X_new.copy(), size=10), fsim)
+        self.assertIs(m._sample_chol_cache(X_new)[None], L)
+        m.kern.lengthscale = 2.
+        self.assertEqual(m._sample_chol_cache(X_new), {})
+        m.sample_chol_cache_max_points = 4
+        m.posterior_samples_f(X_new, size=10)
+        self.assertEqual(m._sample_chol_cache(X_new), {})
+
     def test_normalizer(self):
         k = GPy.kern.RBF(1)
         Y = self.Y
@@ -53,26 +53,46 @@ def force_F_ordered(A):
 #         return jitchol(A+np.eye(A.shape[0])*jitter, maxtries-1)
 
 
-def jitchol(A, maxtries=5):
-    A = np.ascontiguousarray(A)
-    L, info = lapack.dpotrf(A, lower=1)
-    if info == 0:
-        return L
+def jitchol(A, maxtries=5, overwrite_A=False):
+    """
+    Lower Cholesky factor of A, adding jitter to the diagonal if A is not
+    numerically positive definite.
+
+    :param overwrite_A: if True and A is Fortran contiguous, factorise A in
+                        place instead of copying it. A must not be used
+                        afterwards (it is the returned factor).
+    """
+    if overwrite_A and A.flags.f_contiguous:
+        # dpotrf only works on the lower triangle, so if A turns out not to
+        # be pd it can be restored from the upper triangle and the diagonal
+        diagA = np.diag(A).copy()
+        L, info = lapack.dpotrf(A, lower=1, overwrite_a=1, clean=0)
+        if info == 0:
+            for j in range(1, L.shape[1]):
+                L[:j, j] = 0.
+            return L
+        A = np.triu(A, 1)
+        A += A.T
+        A[np.diag_indices_from(A)] = diagA
     else:
-        diagA = np.diag(A)
-        if np.any(diagA <= 0.):
-            raise linalg.LinAlgError("not pd: non-positive diagonal elements")
-        jitter = diagA.mean() * 1e-6
-        num_tries = 1
-        while num_tries <= maxtries and np.isfinite(jitter):
-            try:
-                L = linalg.cholesky(A + np.eye(A.shape[0]) * jitter, lower=True)
-                return L
-            except:
-                jitter *= 10
-            finally:
-                num_tries += 1
-        raise linalg.LinAlgError("not positive definite, even with jitter.")
+        A = np.ascontiguousarray(A)
+        L, info = lapack.dpotrf(A, lower=1)
+        if info == 0:
+            return L
+    diagA = np.diag(A)
+    if np.any(diagA <= 0.):
+        raise linalg.LinAlgError("not pd: non-positive diagonal elements")
+    jitter = diagA.mean() * 1e-6
+    num_tries = 1
+    while num_tries <= maxtries and np.isfinite(jitter):
+        try:
+            L = linalg.cholesky(A + np.eye(A.shape[0]) * jitter, lower=True)
+            return L
+        except:
+            jitter *= 10
+        finally:
+            num_tries += 1
+    raise linalg.LinAlgError("not positive definite, even with jitter.")
     import traceback
     try: raise
     except:
@@ -113,6 +133,32 @@ def dtrtrs(A, B, lower=1, trans=0, unitdiag=0):
     #Note: B does not seem to need to be F ordered!
     return lapack.dtrtrs(A, B, lower=lower, trans=trans, unitdiag=unitdiag)
 
+def dtrsm(A, B, lower=1, trans=0, unitdiag=0):
+    """
+    Wrapper for blas dtrsm function
+
+    DTRSM solves a triangular system with multiple right hand sides,
+
+        A * X = B  or  A**T * X = B,
+
+    directly in BLAS, without the LAPACK argument checking of dtrtrs.
+    B is copied once into a Fortran ordered buffer which is solved in place,
+    so B itself is not modified. If A is single precision, the system is
+    solved in single precision (strsm).
+
+    :param A: Matrix A(triangular)
+    :param B: Matrix B
+    :param lower: is matrix lower (true) or upper (false)
+    :returns: Solution to A * X = B or A**T * X = B
+
+    """
+    A = np.asfortranarray(A)
+    if A.dtype == np.float32:
+        X = np.array(B, dtype=np.float32, order='F')
+        return blas.strsm(1.0, A, X, lower=lower, trans_a=trans, diag=unitdiag, overwrite_b=1)
+    X = np.array(B, dtype=np.float64, order='F')
+    return blas.dtrsm(1.0, A, X, lower=lower, trans_a=trans, diag=unitdiag, overwrite_b=1)
+
 def dpotrs(A, B, lower=1):
     """
     Wrapper for lapack dpotrs function
@@ -352,6 +398,72 @@ def DSYR_numpy(A, x, alpha=1.):
 def DSYR(*args, **kwargs):
     return DSYR_blas(*args, **kwargs)
 
+def DSYRK_blas(C, A, alpha=1.):
+    """
+    Performs a symmetric rank-k update operation:
+    returns C + alpha * np.dot(A.T, A)
+
+    Only the lower triangle is computed (a single BLAS pass, no temporary
+    for A.T*A), the upper triangle is filled in afterwards.
+    C is not modified. If both C and A are single precision, the update is
+    done in single precision (ssyrk).
+
+    :param C: Symmetric NxN np.array
+    :param A: KxN np.array
+    :param alpha: scalar
+
+    """
+    if (C.dtype == 'float32') and (A.dtype == 'float32'):
+        syrk = blas.ssyrk
+    elif (C.dtype == 'float64') and (A.dtype == 'float64'):
+        syrk = blas.dsyrk
+    else:
+        return DSYRK_numpy(C, A, alpha)
+    out = np.array(C, order='F', copy=True)
+    out = syrk(alpha=alpha, a=np.asfortranarray(A), beta=1.0, c=out,
+               overwrite_c=1, trans=1, lower=1)
+    symmetrify(out)
+    return out
+
+def DSYRK_numpy(C, A, alpha=1.):
+    """
+    Performs a symmetric rank-k update operation:
+    returns C + alpha * np.dot(A.T, A)
+
+    :param C: Symmetric NxN np.array
+    :param A: KxN np.array
+    :param alpha: scalar
+
+    """
+    return C + alpha * np.dot(A.T, A)
+
+def DSYRK(*args, **kwargs):
+    return DSYRK_blas(*args, **kwargs)
+
+def schur_complement(L, Kx, Kxx):
+    """
+    Returns Kxx - Kx.T * (L * L.T)^-1 * Kx, for the lower Cholesky factor L,
+    as a triangular solve followed by a symmetric rank-k update.
+
+    note: tries to use cython, falls back to dtrsm and DSYRK
+    """
+    # extensions built before schur_complement was added do not have it
+    if (use_linalg_cython and hasattr(linalg_cython, 'schur_complement')
+            and L.dtype == np.float64 and Kxx.dtype == np.float64):
+        return _schur_complement_cython(L, Kx, Kxx)
+    return _schur_complement_numpy(L, Kx, Kxx)
+
+def _schur_complement_cython(L, Kx, Kxx):
+    # both are written to, so they are always copied
+    tmp = np.array(Kx, dtype=np.float64, order='F')
+    out = np.array(Kxx, order='F')
+    linalg_cython.schur_complement(np.asfortranarray(L), tmp, out)
+    symmetrify(out)
+    return out
+
+def _schur_complement_numpy(L, Kx, Kxx):
+    return DSYRK(Kxx, dtrsm(L, Kx), alpha=-1.)
+
 
 def symmetrify(A, upper=False):
     """
@@ -362,7 +474,7 @@ def symmetrify(A, upper=False):
 
     note: tries to use cython, falls back to a slower numpy version
     """
-    if use_linalg_cython:
+    if use_linalg_cython and A.dtype == np.float64:
         _symmetrify_cython(A, upper)
     else:
         _symmetrify_numpy(A, upper)
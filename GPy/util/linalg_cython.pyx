@@ -1,6 +1,7 @@
 from libc.math cimport sqrt
 cimport numpy as np
 from cpython cimport bool
+cimport scipy.linalg.cython_blas as cblas
 import cython
 
 @cython.boundscheck(False)
@@ -35,3 +36,21 @@ def cholupdate(np.ndarray[double, ndim=1] x, np.ndarray[double, ndim=2] L, int N
                 L[i, j] = (L[i, j] + s * x[i]) / c
                 x[i] = c * x[i] - s * L[i, j]
             r = sqrt(L[j, j])
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+def schur_complement(double[::1, :] L, double[::1, :] Kx, double[::1, :] Kxx):
+    """
+    Kxx - (L^-1 Kx)^T (L^-1 Kx), computed in place in the lower triangle of
+    Kxx. Kx is overwritten with L^-1 Kx. All arrays are Fortran ordered.
+    """
+    cdef int N = Kx.shape[0]
+    cdef int M = Kx.shape[1]
+    cdef double one = 1.
+    cdef double minus_one = -1.
+    if N == 0 or M == 0:
+        return
+    with nogil:
+        cblas.dtrsm('l', 'l', 'n', 'n', &N, &M, &one, &L[0, 0], &N, &Kx[0, 0], &N)
+        cblas.dsyrk('l', 't', &M, &N, &minus_one, &Kx[0, 0], &N, &one, &Kxx[0, 0], &M)
@@ -173,6 +173,7 @@ setup(name = 'GPy',
       extras_require = {'docs':['sphinx'],
                         'optional':['mpi4py',
                                     'ipython>=4.0.0',
+                                    'numba',
                                     ],
                         'plotting':['matplotlib >= 3.0',
                                     'plotly >= 1.8.6'],